@@ -0,0 +1,68 @@
+'''
+Monotone bucket priority queue used as the A* frontier by the pathfinder.
+'''
+from collections import deque
+from typing import *
+
+T = TypeVar("T")
+
+class BucketQueue(Generic[T]):
+    """
+    Priority queue for small, non-negative int priorities that never decrease below the
+    last one popped (Dial's algorithm), as is the case for the f(n) values popped by A*
+    with a consistent heuristic and integer costs. Each priority maps to a FIFO bucket,
+    so pushes and pops are O(1) deque operations rather than O(log n) sifts, and items
+    of equal priority are popped in the order they were pushed.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs a new, empty BucketQueue.
+        """
+        self._buckets: dict[int, deque[T]] = {}
+        self._min_priority: int = 0
+        self._size: int = 0
+
+    def push(self, priority: int, item: T) -> None:
+        """
+        Adds the given item to the queue with the given priority.
+
+        Parameters:
+            priority (int):
+                The item's priority, where lower values are popped first. Must not be lower
+                than the priority of the last item popped.
+            item (T):
+                The item to add.
+        """
+        if priority < self._min_priority:
+            raise ValueError("[X] Priority " + str(priority) + " is below the last priority popped: " + str(self._min_priority))
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = deque()
+        bucket.append(item)
+        self._size += 1
+
+    def pop(self) -> T:
+        """
+        Removes and returns the earliest-pushed item with the lowest priority in the queue.
+
+        Returns:
+            T:
+                The item removed from the queue.
+        """
+        if not self._size:
+            raise IndexError("[X] Cannot pop from an empty BucketQueue")
+        buckets = self._buckets
+        priority = self._min_priority
+        bucket = buckets.get(priority)
+        while not bucket:
+            if bucket is not None:
+                del buckets[priority]
+            priority += 1
+            bucket = buckets.get(priority)
+        self._min_priority = priority
+        self._size -= 1
+        return bucket.popleft()
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,42 @@
+from bucket_queue import *
+import unittest
+
+class BucketQueueTests(unittest.TestCase):
+    """
+    Unit tests for validating the BucketQueue used as the pathfinder's frontier.
+    """
+
+    def test_bucket_queue_t0(self) -> None:
+        queue: BucketQueue[str] = BucketQueue()
+        queue.push(3, "c")
+        queue.push(1, "a")
+        queue.push(2, "b")
+        self.assertEqual(3, len(queue))
+        self.assertEqual(["a", "b", "c"], [queue.pop() for _ in range(3)])
+        self.assertEqual(0, len(queue))
+
+    def test_bucket_queue_t1(self) -> None:
+        # Ties are popped in the order they were pushed
+        queue: BucketQueue[str] = BucketQueue()
+        queue.push(2, "first")
+        queue.push(2, "second")
+        queue.push(5, "last")
+        queue.push(2, "third")
+        self.assertEqual(["first", "second", "third", "last"], [queue.pop() for _ in range(4)])
+
+    def test_bucket_queue_t2(self) -> None:
+        # Pushes between pops may reuse the current priority, but not go below it
+        queue: BucketQueue[int] = BucketQueue()
+        queue.push(4, 0)
+        self.assertEqual(0, queue.pop())
+        queue.push(4, 1)
+        queue.push(6, 2)
+        self.assertEqual(1, queue.pop())
+        with self.assertRaises(ValueError):
+            queue.push(3, 3)
+        self.assertEqual(2, queue.pop())
+        with self.assertRaises(IndexError):
+            queue.pop()
+
+if __name__ == '__main__':
+    unittest.main()
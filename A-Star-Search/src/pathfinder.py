@@ -7,11 +7,16 @@ necessary for implementing the A* pathfinder that solves the target practice pro
 '''
 import queue
 from maze_problem import MazeProblem
+from constants import Constants
+from bucket_queue import BucketQueue
 from dataclasses import *
 from typing import *
 
 from typing import List, Tuple, Optional, Dict, Set
-import heapq
+
+# A search state: the player's location and a bitmask of the targets still left to shoot,
+# where bit i is set while the i-th of the maze's initial targets remains
+State = Tuple[Tuple[int, int], int]
 
 #>> [NO] The SearchTreeNode class is incredibly helpful for this problem, tracking location, parent, and you should add a cost and targets_left
 # allows for all the information you need to be conveniently stored in individual nodes representing maze states.
@@ -34,6 +39,82 @@ class SearchTreeNode:
     parent: Optional["SearchTreeNode"]
     # TODO: Add any other attributes and method overrides as necessary!
     
+def heuristic(player_loc: Tuple[int, int], all_targets: Tuple[Tuple[int, int], ...], targets_left: int) -> int:
+    """
+    Admissible estimate of the cost left to shoot all remaining targets from the given
+    location: the fewest moves needed to line up with the nearest target (ignoring walls),
+    plus the cost of at least one shot.
+
+    Parameters:
+        player_loc (tuple[int, int]):
+            The player's location in the state being estimated.
+        all_targets (tuple[tuple[int, int], ...]):
+            The maze's initial targets, in the order used by the targets_left bitmask.
+        targets_left (int):
+            Bitmask of the targets that have yet to be shot in that state.
+
+    Returns:
+        int:
+            A lower bound on the cost of reaching a goal state, or 0 if no targets are left.
+    """
+    if not targets_left:
+        return 0
+    min_distance = float('inf')
+    remaining = targets_left
+    while remaining:
+        # Visit only the set bits, lowest first
+        target = all_targets[(remaining & -remaining).bit_length() - 1]
+        remaining &= remaining - 1
+        min_distance = min(min_distance, abs(player_loc[0] - target[0]), abs(player_loc[1] - target[1]))
+    return int(min_distance) + Constants.SHOOTING_COST
+
+def retrace_path(Total_Nodes: Dict[State, Tuple[Optional[State], Optional[str]]], goal_state: State) -> List[str]:
+    """
+    Retraces the optimal path from the initial state to the given goal state by following
+    each state's recorded parent back to the root.
+
+    Parameters:
+        Total_Nodes (dict[State, tuple[Optional[State], Optional[str]]]):
+            Maps each generated state to its parent state and the action that reached it
+            (both None for the root).
+        goal_state (State):
+            The goal state at which the search ended.
+
+    Returns:
+        list[str]:
+            The sequence of actions leading from the initial state to the goal state.
+    """
+    path = []
+    current_state: Optional[State] = goal_state
+    while current_state is not None:
+        parent_state, action = Total_Nodes[current_state]
+        if action is not None:
+            path.append(action)
+        current_state = parent_state
+    return path[::-1]  # Reverse the path
+
+def shoot_if_optimal(targets: int, visible_targets: int) -> Tuple[bool, int]:
+    """
+    Decides whether shooting from a state is worthwhile and, if so, which targets would be
+    left afterwards.
+
+    Parameters:
+        targets (int):
+            Bitmask of the targets left in the state being expanded.
+        visible_targets (int):
+            Bitmask of the targets left that a shot from the state's location would hit.
+
+    Returns:
+        tuple[bool, int]:
+            Whether a shot should be taken, and the bitmask of targets left after it.
+    """
+    # Safety
+    if visible_targets:
+        # Shooting criteria
+        if targets.bit_count() >= 2 or targets == visible_targets:
+            return True, targets & ~visible_targets
+    return False, targets
+
 def pathfind(problem: "MazeProblem") -> Optional[list[str]]:
     """
     The main workhorse method of the package that performs A* graph search to find the optimal
@@ -57,7 +138,7 @@ def pathfind(problem: "MazeProblem") -> Optional[list[str]]:
     #   - Goal test on expansion not generation - Done
     #   - Turn frontier into a priority queue - Done
     #----------------------------------------------------------------------------------------------------# - Current Problem
-    #   - Root node revisitation --> Not Solved
+    #   - Root node revisitation --> Solved (states keyed by location + targets left)
     #----------------------------------------------------------------------------------------------------# - Helper Functions
     #   - get_inital_loc
     #   - get_inital_targets
@@ -65,120 +146,94 @@ def pathfind(problem: "MazeProblem") -> Optional[list[str]]:
     #   - get_visible_targets_from_loc --> player_loc, targets_left
     #   - get_transitions --> player_loc, targets_left
     #----------------------------------------------------------------------------------------------------#
-    # h(n) --> Min Distance from Targets + Alignment Bonus
-
-    #>>[NO] Provide docstrings for ALL methods even helpers (-0.25)
-    def heuristic(current_node: Tuple[int, int], target_locs: Set[Tuple[int, int]]) -> float: # WORKS 
-        min_distance = float('inf')
-        aligned_bonus = 0
-        for target in target_locs:
-            # Calculate Manhattan distance to each target
-            distance = abs(current_node[0] - target[0]) + abs(current_node[1] - target[1])
-            is_aligned = current_node[0] == target[0] or current_node[1] == target[1]
-            # If aligned
-            if is_aligned:
-                aligned_bonus = 1
-            # Update the minimum distance considering alignment
-            min_distance = min(min_distance, distance - aligned_bonus)
-        return min_distance
-
-
-    # Retrace optimal path from I.S. to G.S.
-    def retrace_path(Total_Nodes: Dict[Tuple[int, int], Tuple[Optional[Tuple[int, int]], Optional[str]]],
-    goal_node: Tuple[int, int]) -> List[str]: # WORKS 
-        path = []
-        current_node = goal_node
-        while current_node is not None:
-            parent_node, actions = Total_Nodes[current_node]
-            if actions:  # Make sure action taken to reach this node are valid
-                if isinstance(actions, list):
-                    # Add all actions except None
-                    path.extend([action for action in actions if action is not None][::-1])
-                elif actions is not None:
-                    path.append(actions)
-            current_node = parent_node
-        return path[::-1]  # Reverse the path
-    
-
-    def shoot_if_optimal(targets: Set[Tuple[int, int]], visible_targets: Set[Tuple[int, int]]) -> Tuple[bool, Set[Tuple[int, int]]]: # WORKS
-        targets_shot = set([])
-        # Safety
-        if len(visible_targets) > 0:
-            # Shooting criteria
-            if len(targets) >= 2 or len(targets) == len(visible_targets):
-                # Remove the targets hit from the set of targets
-                for target in visible_targets:
-                    Target_Locs.remove(target)
-                    targets_shot.add(target)
-                    print("Shot", target, "from node", current_node)
-                return True, targets_shot
-        #>> [NO] Remove print statements before submission, it really slows down the code (-0.25)
-        print("Did not shoot the following targets:", targets)
-        return False, targets_shot
-    
+    # h(n) --> Min Distance to line up with a Target + Shooting Cost
 
+    # Search states are keyed by (player_loc, targets_left): the same cell with different
+    # targets remaining is a different state. Total_Cost holds the best g(n) found for each
+    # state; a heap entry whose g(n) is worse than that is stale and skipped when popped
+    # (a lazy decrease-key), so each state is only expanded once
     root_node: Tuple[int, int] = problem.get_initial_loc()
-    Target_Locs: Set[Tuple[int, int]] = problem.get_initial_targets()
-    Total_Node_History: Dict[Tuple[int, int], Tuple[Optional[Tuple[int, int]], Union[None, str, List[str]]]] = {root_node: (None, [])}
-    Total_Cost: Dict[Tuple[int, int], int] = {root_node: 0}
-    frontier: List[Tuple[float, Tuple[int, int]]] = []
+    initial_targets: Set[Tuple[int, int]] = problem.get_initial_targets()
+    all_targets: Tuple[Tuple[int, int], ...] = tuple(initial_targets)
+    target_bits: Dict[Tuple[int, int], int] = {target: 1 << index for index, target in enumerate(all_targets)}
+    root_targets: int = (1 << len(all_targets)) - 1
+    root_state: State = (root_node, root_targets)
+    Total_Node_History: Dict[State, Tuple[Optional[State], Optional[str]]] = {root_state: (None, None)}
+    Total_Cost: Dict[State, int] = {root_state: 0}
+    # Prioritized by f(n); ties are popped in FIFO order, so entries never compare their states
+    frontier: BucketQueue[Tuple[int, Tuple[int, int], int]] = BucketQueue()
+    # Local aliases spare an attribute lookup on every use in the loop below
+    push, pop = frontier.push, frontier.pop
+    get_visible_targets = problem.get_visible_targets_from_loc
+    get_transitions = problem.get_transitions
+    get_cost = problem.get_transition_cost
+    # Walls and mud never change, so each cell's moves and their costs are compiled once on
+    # its first expansion and shared by every state at that cell (only live targets block moves)
+    # (each move also records the bit of the target on its next cell, or 0 if there is none)
+    moves_from: Dict[Tuple[int, int], List[Tuple[str, Tuple[int, int], int, int]]] = {}
+    no_targets: Set[Tuple[int, int]] = set()
+    # Bitmask of the initial targets visible from each cell, which depends only on the walls
+    visible_from: Dict[Tuple[int, int], int] = {}
+    # Heuristic values per state; a bitmask is only meaningful within this search
+    h_values: Dict[State, int] = {}
     
 
-    heapq.heappush(frontier, (0, root_node))
+    push(heuristic(root_node, all_targets, root_targets), (0, root_node, root_targets))
     
 
     while frontier:
-        print("New Nodes Added to Frontier:", frontier)
         # Pop expanding node
-        current_priority, current_node = heapq.heappop(frontier)
-        print("\n", "Current Node Location", current_priority, current_node)
-        # Check if a shot is possible and optimal before moving
-        visible_targets = problem.get_visible_targets_from_loc(current_node, Target_Locs)
-        shot_made, targets_shot = shoot_if_optimal(Target_Locs, visible_targets)
-
-        if shot_made and targets_shot:      
-            # Get the previous actions for the current node
-            previous_actions = Total_Node_History.get(current_node, (None, None))[1]
-            # If previous_actions is None
-            if previous_actions is None:
-                previous_actions = []
-
-            # If previous_actions is a single string
-            elif isinstance(previous_actions, str):
-                previous_actions = [previous_actions]
-
-            previous_actions.append("S")
-
-            # Append the shooting action
-            Total_Node_History[current_node] = (Total_Node_History[current_node][0], previous_actions)
-            Total_Cost[current_node] += problem.get_transition_cost("S", current_node)
-
-            # Check Goal State
-            if len(Target_Locs) == 0:
-                # All targets hit, call retrace path
-                actions = retrace_path(Total_Node_History, current_node) # 6/8 tests passed :(
-                print("\n", "SHOT ALL TARGETS!", "\n", "Actions that led to goal state:", actions, "\n", "Total Node History:", Total_Node_History, "\n", "Total Cost History:", Total_Cost)
-                return actions
-
-        for direction, child in problem.get_transitions(current_node, Target_Locs).items():
-            child_location = child['next_loc']
-            child_cost = problem.get_transition_cost(direction, child_location)
+        g_current, current_node, targets_left = pop()
+        current_state: State = (current_node, targets_left)
+        if g_current > Total_Cost[current_state]:
+            continue
+
+        # Check Goal State
+        if not targets_left:
+            return retrace_path(Total_Node_History, current_state)
+
+        children: List[Tuple[str, Tuple[int, int], int, int]] = []
+        # Check if a shot is possible and optimal from here (shots pass through targets, so
+        # the live targets hit are those visible among all targets that are still left)
+        visible_targets = visible_from.get(current_node)
+        if visible_targets is None:
+            visible_targets = 0
+            for target in get_visible_targets(current_node, initial_targets):
+                visible_targets |= target_bits[target]
+            visible_from[current_node] = visible_targets
+        shot_made, targets_after_shot = shoot_if_optimal(targets_left, visible_targets & targets_left)
+        if shot_made:
+            children.append(("S", current_node, targets_after_shot, get_cost("S", current_node)))
+
+        moves = moves_from.get(current_node)
+        if moves is None:
+            moves = [(direction, child['next_loc'], get_cost(direction, child['next_loc']), target_bits.get(child['next_loc'], 0))
+                     for direction, child in get_transitions(current_node, no_targets).items() if direction != "S"]
+            moves_from[current_node] = moves
+        for direction, child_location, move_cost, blocking_target in moves:
+            if not blocking_target & targets_left:
+                children.append((direction, child_location, targets_left, move_cost))
+
+        for direction, child_location, child_targets, child_cost in children:
+            child_state: State = (child_location, child_targets)
             # g(child)
-            g_child = Total_Cost[current_node] + child_cost
-            # h(child)
-            h_child = heuristic(child_location, Target_Locs)
-            # f(child)
-            f_child = g_child + h_child
-
-            print("g(n) + h(n) = f(n)", g_child, "+", h_child, "=", f_child, "Child Location", child_location)
-            if child_location not in Total_Cost or g_child <= Total_Cost[child_location] and child_location != current_node:
-                heapq.heappush(frontier, (f_child, child_location))
-                Total_Cost[child_location] = g_child
-                Total_Node_History[child_location] = (current_node, [direction])
-
-        if not frontier: # If every node has been expanded
-            print(Total_Node_History)
-            return None
+            g_child = g_current + child_cost
+            # Relax only on a strict improvement: a child reached again at equal cost would
+            # just be a duplicate frontier entry. As every action costs more than 0, this
+            # also never relaxes the current state itself (a shot changes targets_left, so
+            # it leads to a new state even though the location stays the same)
+            if g_child < Total_Cost.get(child_state, float('inf')):
+                Total_Cost[child_state] = g_child
+                Total_Node_History[child_state] = (current_state, direction)
+                # f(child) = g(child) + h(child)
+                h_child = h_values.get(child_state)
+                if h_child is None:
+                    h_child = h_values[child_state] = heuristic(child_location, all_targets, child_targets)
+                f_child = g_child + h_child
+                push(f_child, (g_child, child_location, child_targets))
+
+    # Every reachable state has been expanded without shooting all targets
+    return None
 
 # ===================================================
 # >>> [NO] Summary
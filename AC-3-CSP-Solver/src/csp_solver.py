@@ -12,7 +12,19 @@ from datetime import *
 from date_constraints import *
 from dataclasses import *
 from copy import *
+from collections import deque, defaultdict
+import operator
 
+# Comparison function for each DateConstraint operator, matching DateConstraint._dates_satisfy,
+# so hot loops can call C-level comparisons instead of dispatching on the OP string per call
+_OPERATORS: dict[str, Callable[[datetime, datetime], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
 
 # CSP Backtracking Solver
 # ---------------------------------------------------------------------------
@@ -54,20 +66,42 @@ def solve(n_meetings: int, date_range: set[datetime], constraints: set[DateConst
     domains = [set(date_range) for _ in range(n_meetings)]
     node_consistency(domains, constraints)
     arc_consistency(domains, constraints)
+    # Pruned domains are only iterated from here on, so store them as sorted tuples
+    ordered_domains: list[tuple[datetime, ...]] = [tuple(sorted(domain)) for domain in domains]
+    # Static Minimum-Remaining-Values ordering: meetings with the fewest dates left after
+    # filtering are assigned first, so dead ends are found near the root of the search tree.
+    # The assignment list holds dates in this order; position maps a meeting to its slot in it
+    order: list[int] = sorted(range(n_meetings), key=lambda index: len(ordered_domains[index]))
+    position: list[int] = [0] * n_meetings
+    for depth, meeting_index in enumerate(order):
+        position[meeting_index] = depth
+
+    # Binary constraints indexed by each meeting they mention, so only relevant ones are checked per
+    # assignment (unary constraints are already enforced on the domains by node consistency). Each
+    # is compiled once to its meetings' positions in the assignment and its comparison function
+    constraints_by_var: dict[int, list[tuple[int, int, Callable[[datetime, datetime], bool]]]] = defaultdict(list)
+    for constraint in constraints:
+        if isinstance(constraint.R_VAL, int):
+            check = (position[constraint.L_VAL], position[constraint.R_VAL], _OPERATORS[constraint.OP])
+            constraints_by_var[constraint.L_VAL].append(check)
+            constraints_by_var[constraint.R_VAL].append(check)
 
     def evaluate_constraints(assignment: List[datetime], current_index: int) -> bool:
         '''
-        Evaluates all relevant constraints for the meeting scheduled at the given index
-        in the assignment list to ensure the current state of the assignment does not violate
+        Evaluates all relevant constraints for the meeting with the given index, whose date
+        was last added to the assignment list, to ensure the current state of the assignment does not violate
         any constraints.
 
         This function is typically called after adding or changing the date of a meeting in
         the assignment list to check if the change adheres to all specified constraints
-        involving the changed meeting's date.
+        involving the changed meeting's date. Only binary constraints whose other meeting
+        has already been assigned are tested, since those are the only ones whose scope
+        was just completed by the change.
 
         Parameters:
             assignment (List[datetime]):
-                A list of datetimes where each index corresponds to a scheduled meeting. 
+                A list of datetimes where each entry corresponds to a scheduled meeting, in
+                the MRV assignment order (i.e., meeting m's date is at assignment[position[m]]).
                 The list length equals the current number of scheduled meetings, which may be
                 less than the total required if the scheduling is in progress.
             current_index (int):
@@ -81,20 +115,15 @@ def solve(n_meetings: int, date_range: set[datetime], constraints: set[DateConst
                 the assignment, False otherwise. If False, the latest change causes a conflict
                 and should be reconsidered or backtracked.
         '''
-        for constraint in constraints:
-            if constraint.L_VAL == current_index or (isinstance(constraint.R_VAL, int) and constraint.R_VAL == current_index):
-                if len(assignment) <= constraint.L_VAL:
-                    continue
-                left_date = assignment[constraint.L_VAL] if len(assignment) > constraint.L_VAL else None
-                right_date = constraint.R_VAL if isinstance(constraint.R_VAL, datetime) else (
-                    assignment[constraint.R_VAL] if len(assignment) > constraint.R_VAL else None)
-                
-                if left_date is not None and right_date is not None:
-                    if not constraint.is_satisfied_by_values(left_date, right_date):
-                        return False
+        n_assigned = len(assignment)
+        for left_position, right_position, is_satisfied in constraints_by_var[current_index]:
+            if left_position >= n_assigned or right_position >= n_assigned:
+                continue
+            if not is_satisfied(assignment[left_position], assignment[right_position]):
+                return False
         return True
 
-    def backtrack(assignment: List[datetime], meeting_index: int = 0) -> Optional[List[datetime]]:
+    def backtrack(assignment: List[datetime], depth: int = 0) -> Optional[List[datetime]]:
         '''
         Recursively tries to assign dates to meetings and checks constraints at each step
         to find a solution that satisfies all constraints. This function employs the backtracking
@@ -102,32 +131,36 @@ def solve(n_meetings: int, date_range: set[datetime], constraints: set[DateConst
 
         Parameters:
             assignment (List[datetime]):
-                The current list of assigned dates to meetings; partially filled.
-            meeting_index (int, optional):
-                The index of the meeting to try and assign a date to. Starts at 0 and increments
-                as deeper levels of the recursion assign dates to subsequent meetings.
+                The current list of assigned dates to meetings, in MRV order; partially filled.
+            depth (int, optional):
+                The number of meetings assigned so far; the meeting to try and assign a date to
+                next is order[depth]. Starts at 0 and increments as deeper levels of the
+                recursion assign dates to subsequent meetings.
 
         Returns:
             Optional[List[datetime]]:
                 If a valid assignment for all meetings is found that satisfies all constraints:
-                    Returns a list of datetimes, one for each meeting.
+                    Returns a list of datetimes, one for each meeting, in MRV order.
                 If no valid assignment is found:
                     Returns None, indicating failure to find a solution.
         '''
-        if meeting_index == n_meetings:
-            return assignment[:] if evaluate_constraints(assignment, meeting_index - 1) else None
+        if depth == n_meetings:
+            return assignment[:]
 
-        for date in domains[meeting_index]:
+        meeting_index = order[depth]
+        for date in ordered_domains[meeting_index]:
             assignment.append(date)
             if evaluate_constraints(assignment, meeting_index):
-                result = backtrack(assignment, meeting_index + 1)
+                result = backtrack(assignment, depth + 1)
                 if result:
                     return result
             assignment.pop()
 
         return None
 
-    results = backtrack([])
+    ordered_results = backtrack([])
+    # Restore the solution to meeting index order
+    results = [ordered_results[position[meeting_index]] for meeting_index in range(n_meetings)] if ordered_results else None
 
     if results:
         print("All constraints are satisfied.", results)
@@ -166,11 +199,9 @@ def node_consistency(domains: list[set[datetime]], constraints: set[DateConstrai
     for constraint in constraints:
         if constraint.arity() == 1:
             meeting_index = constraint.L_VAL
-            valid_dates = set()
-            for date in domains[meeting_index]:
-                if constraint.is_satisfied_by_values(date, None):
-                    valid_dates.add(date)
-            domains[meeting_index] = valid_dates
+            is_satisfied = _OPERATORS[constraint.OP]
+            fixed_date = cast(datetime, constraint.R_VAL)
+            domains[meeting_index] = {date for date in domains[meeting_index] if is_satisfied(date, fixed_date)}
 
 # CSP Filtering: Arc Consistency
 # ---------------------------------------------------------------------------
@@ -250,22 +281,38 @@ def arc_consistency(domains: list[set[datetime]], constraints: set[DateConstrain
         directly within the provided domains parameter
     '''
     # [!] TODO: Implement AC-3 Preprocessing Filtering
-    queue = [Arc(constraint) for constraint in constraints if constraint.arity() == 2]
+    # Both directions of each constraint's arc, stored side by side so that the reverse of the
+    # arc at index i is at index i ^ 1; the queue holds arc indexes, each at most once
+    arcs: list[Arc] = []
+    for constraint in constraints:
+        if constraint.arity() == 2:
+            arcs.append(Arc(constraint))
+            arcs.append(Arc(constraint.get_reverse()))
+    queue: deque[int] = deque(range(len(arcs)))
+    queued = [True] * len(arcs)
+    # Arc indexes by their HEAD, i.e., those that must be rechecked when that variable's domain shrinks
+    neighbors: dict[int, list[int]] = defaultdict(list)
+    for index, arc in enumerate(arcs):
+        neighbors[arc.HEAD].append(index)
 
     while queue:
-        arc = queue.pop(0)
+        index = queue.popleft()
+        queued[index] = False
+        arc = arcs[index]
         if revise(domains, arc):
-            for constraint in constraints:
-                if constraint.arity() == 2:
-                    queue.append(Arc(constraint))
+            # The reverse arc needs no recheck: the TAIL values just removed had no support in
+            # the HEAD's domain, so no HEAD value was supported by them under this constraint
+            for neighbor in neighbors[arc.TAIL]:
+                if neighbor != index ^ 1 and not queued[neighbor]:
+                    queued[neighbor] = True
+                    queue.append(neighbor)
 
 def revise(domains: List[Set[datetime]], arc: Any) -> bool:
     '''
-    Revises the domains of the variables in the constraint satisfaction problem to ensure
-    that all domain values are consistent with the constraints. The function uses the arc
-    consistency algorithm to prune values from the domains that are not consistent with
-    the constraints. If any values are removed from a domain, indicating that a revision
-    was made, the function returns True.
+    Revises the domain of the given arc's TAIL variable so that every value remaining in it
+    is supported by at least one value in the domain of the arc's HEAD. Only the TAIL is
+    pruned; the HEAD is revised by the reversed arc that AC-3 keeps in its queue. If any
+    values are removed from the TAIL's domain, the function returns True.
 
     Parameters:
         domains (List[Set[datetime]]):
@@ -277,9 +324,8 @@ def revise(domains: List[Set[datetime]], arc: Any) -> bool:
             This object must have the following properties:
                 - HEAD: An index pointing to the 'head' variable of the arc in the domains list.
                 - TAIL: An index pointing to the 'tail' variable of the arc.
-                - CONSTRAINT: An object or function that can evaluate whether a given
-                  value pair satisfies the constraint. It must support a method or function
-                  call `is_satisfied_by_values(tail_value, head_value)` that returns a boolean.
+                - CONSTRAINT: The DateConstraint relating the tail (left) to the head (right),
+                  whose OP determines which tail values are supported (see supported_tail_values).
 
     Returns:
         bool:
@@ -287,25 +333,51 @@ def revise(domains: List[Set[datetime]], arc: Any) -> bool:
             otherwise False. This allows for further processing or repeated revision until
             no more changes are made (reaching arc consistency across all variables).
     '''
-    revised = False
-    valid_tail_values = set()
-    valid_head_values = set(domains[arc.HEAD])
+    head_domain = domains[arc.HEAD]
+    tail_domain = domains[arc.TAIL]
+    valid_tail_values = supported_tail_values(arc.CONSTRAINT.OP, tail_domain, head_domain)
 
-    for tail_value in domains[arc.TAIL]:
-        valid = any(arc.CONSTRAINT.is_satisfied_by_values(tail_value, head_value) for head_value in domains[arc.HEAD])
-        if valid:
-            valid_tail_values.add(tail_value)
+    if len(valid_tail_values) != len(tail_domain):
+        domains[arc.TAIL] = valid_tail_values
+        return True
+    return False
 
-    for head_value in domains[arc.HEAD]:
-        valid = any(arc.CONSTRAINT.is_satisfied_by_values(tail_value, head_value) for tail_value in domains[arc.TAIL])
-        if not valid:
-            valid_head_values.remove(head_value)
+def supported_tail_values(op: str, tail_domain: set[datetime], head_domain: set[datetime]) -> set[datetime]:
+    '''
+    Computes, in a single pass over each domain, the values of a tail domain that are supported
+    by at least one value of the head domain under the given relational operator. Since every
+    DateConstraint operator compares totally-ordered datetimes, support never requires testing
+    each (tail, head) pair: it only depends on the head domain's extreme values or members.
 
-    if valid_tail_values != domains[arc.TAIL]:
-        domains[arc.TAIL] = valid_tail_values
-        revised = True
-    if valid_head_values != domains[arc.HEAD]:
-        domains[arc.HEAD] = valid_head_values
-        revised = True
+    Parameters:
+        op (str):
+            The operator of the binary constraint relating the tail (left) to the head (right)
+        tail_domain (set[datetime]):
+            The domain of the arc's TAIL variable, which is being revised
+        head_domain (set[datetime]):
+            The domain of the arc's HEAD variable
 
-    return revised
\ No newline at end of file
+    Returns:
+        set[datetime]:
+            The subset of the tail domain with support in the head domain; raises a
+            ValueError for an operator that is not one of DateConstraint._VALID_OPS
+    '''
+    if not head_domain:
+        return set()
+    if op == "==":
+        return tail_domain & head_domain
+    if op == "!=":
+        return set(tail_domain) if len(head_domain) > 1 else tail_domain - head_domain
+    if op == "<":
+        latest = max(head_domain)
+        return {tail_value for tail_value in tail_domain if tail_value < latest}
+    if op == "<=":
+        latest = max(head_domain)
+        return {tail_value for tail_value in tail_domain if tail_value <= latest}
+    if op == ">":
+        earliest = min(head_domain)
+        return {tail_value for tail_value in tail_domain if tail_value > earliest}
+    if op == ">=":
+        earliest = min(head_domain)
+        return {tail_value for tail_value in tail_domain if tail_value >= earliest}
+    raise ValueError("[X] Cannot compute supported values for invalid operator " + str(op))
@@ -248,9 +248,31 @@ class CSPTests(unittest.TestCase):
         self.assertEqual(3, len(domains[0]))
         self.assertEqual(2, len(domains[1]))
         self.assertEqual(2, len(domains[2]))
-    
+
+    def test_csp_arc_consistency_t7(self) -> None:
+        constraints = {
+            DateConstraint(0, ">", 1),
+            DateConstraint(1, ">=", 2),
+            DateConstraint(2, "<=", 3),
+            DateConstraint(3, "==", datetime(2023, 1, 2))
+        }
+        possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
+        n_meetings = 4
+        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+
+        node_consistency(domains, constraints)
+        arc_consistency(domains, constraints)
+
+        self.assertEqual(4, len(domains[0]))
+        self.assertEqual(4, len(domains[1]))
+        self.assertEqual(2, len(domains[2]))
+        self.assertEqual(1, len(domains[3]))
+        self.assertNotIn(datetime(2023, 1, 1), domains[0])
+        self.assertNotIn(datetime(2023, 1, 5), domains[1])
+        self.assertNotIn(datetime(2023, 1, 3), domains[2])
+
     # TODO
-    
+
     # CSP Backtracker Tests
     # ---------------------------------------------------------------------------
     def test_csp_backtracking_t0(self) -> None:
